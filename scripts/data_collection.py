@@ -2,103 +2,285 @@
 YouTube Comments Data Collection Script
 
 This module provides functions for fetching and collecting YouTube comments data
-from a specified video using the YouTube API. It uses the 'googleapiclient.discovery'
-library for building the API service and 'pandas' for handling data.
+from a specified video using the YouTube API. It calls the 'commentThreads' REST
+endpoint concurrently with 'asyncio' and 'aiohttp', and uses 'pandas' for
+handling data.
 
 Functions:
+    - afetch_youtube_comments: Asynchronously fetches YouTube comments for a given video.
+    - afetch_comments_from_videos: Asynchronously fetches comments for several videos at once.
+    - aiter_comment_batches: Asynchronously yields one batch of comments per API page.
+    - iter_comment_batches: Yields one batch of comments per API page.
     - fetch_youtube_comments: Fetches YouTube comments for a given video.
+    - stream_comments_to_parquet: Streams comments for a video straight into a Parquet file.
     - fetch_batch_data_from_video: Returns a DataFrame of YouTube comments data.
+    - save_comments: Saves the comments DataFrame as Parquet, Feather or CSV.
     - main: Collects YouTube comments data and saves it to a specified output file.
 
 Note:
     To use the functions in this module, ensure you have the necessary API credentials,
-    including a valid YouTube API key, and have the required libraries installed 
-    (e.g., 'pandas', 'google-api-python-client').
+    including a valid YouTube API key, and have the required libraries installed
+    (e.g., 'pandas', 'aiohttp').
 
 Usage:
     Run this module as a script to collect YouTube comments data from a specified video.
     Command Line Example:
         python data_collecton.py --video_id YOUR_VIDEO_ID --output_file OUTPUT_FILE_PATH
 """
+import asyncio
 import logging
 import os
+from pathlib import Path
 from dotenv import load_dotenv
+import numpy as np
 import pandas as pd
-import googleapiclient.errors
-import googleapiclient.discovery
+import pyarrow as pa
+import pyarrow.parquet as pq
+import aiohttp
 import click
 
 
 logging.basicConfig(level=logging.INFO)
-load_dotenv(".env")
+if os.path.exists(".env"):
+    load_dotenv(".env")
 
-try:
-    YOUTUBE_API_KEY = os.environ["YOUTUBE_API_KEY"]
-except:
-    raise Exception("Create an .env file on the project root with the YOUTUBE_API_KEY")
+YOUTUBE_API_KEY = os.environ.get("YOUTUBE_API_KEY")
+if not YOUTUBE_API_KEY:
+    raise RuntimeError("Create an .env file on the project root with the YOUTUBE_API_KEY")
 
 
-def fetch_youtube_comments(target, video, results, service, version, key):
+COMMENT_THREADS_URL = "https://www.googleapis.com/youtube/v3/commentThreads"
+
+# Upper bound on simultaneous connections to the API, shared by all
+# videos fetched through one session.
+CONNECTION_LIMIT = 20
+
+# Largest page size the commentThreads endpoint will actually serve.
+MAX_PAGE_SIZE = 100
+
+
+async def _afetch_page(session, params):
+    """Fetches a single commentThreads page and returns the decoded JSON response."""
+    async with session.get(COMMENT_THREADS_URL, params=params) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def afetch_youtube_comments(target, video, results, key, session=None):
     """
-    Fetches YouTube comments for a given video.
+    Asynchronously fetches YouTube comments for a given video.
 
     Args:
         target (str): The part parameter specifies a comma-separated list
                       of commentThread resource properties.
         video (str): The ID of the video for which the comments are fetched.
         results (int): The maximum number of comments to retrieve.
-        service (str): The API service to use for fetching comments.
-        version (str): The API version to use.
         key (str): The API key for authentication.
+        session (aiohttp.ClientSession, optional): An open session to reuse across
+                                                   requests. A temporary one is
+                                                   created when omitted.
 
     Returns:
-        list: A list containing information about each comment, including
-              author name, publication date, update date, like count,
-              and comment text.
+        dict: One list per column ('author', 'published_at', 'updated_at',
+              'likes', 'text'), each holding the values for every fetched
+              comment in page order.
 
     Raises:
-        Any exceptions raised during the API request.
+        aiohttp.ClientResponseError: If the API responds with an error status.
 
     Note:
-        This function uses the YouTube API to fetch comments and may require
-        appropriate API credentials.
+        Pages of a single video are chained through 'nextPageToken', so they are
+        fetched in order; concurrency comes from fetching several videos at once
+        through 'afetch_comments_from_videos'. Values are accumulated per column
+        so pandas can build the DataFrame without row-wise dtype inference.
+    """
+    columns = {
+        "author": [],
+        "published_at": [],
+        "updated_at": [],
+        "likes": [],
+        "text": [],
+    }
+    async for batch in aiter_comment_batches(
+        target, video, results, key, session=session
+    ):
+        for name, values in batch.items():
+            columns[name].extend(values)
+    return columns
+
+
+async def aiter_comment_batches(target, video, results, key, session=None):
     """
-    youtube = googleapiclient.discovery.build(service, version, developerKey=key)
+    Asynchronously yields one column dict of comments per commentThreads page.
+
+    Args:
+        target (str): The part parameter specifies a comma-separated list
+                      of commentThread resource properties.
+        video (str): The ID of the video for which the comments are fetched.
+        results (int): The maximum number of comments to retrieve.
+        key (str): The API key for authentication.
+        session (aiohttp.ClientSession, optional): An open session to reuse across
+                                                   requests. A temporary one is
+                                                   created when omitted.
+
+    Yields:
+        dict: One list per column ('author', 'published_at', 'updated_at',
+              'likes', 'text') holding the comments of a single API page.
 
-    request = youtube.commentThreads().list(
-        part=target, videoId=video, maxResults=results
-    )
+    Note:
+        Only one page is held in memory at a time, so callers can stream
+        comments to disk instead of materialising the whole video.
+    """
+    if session is None:
+        connector = aiohttp.TCPConnector(limit=CONNECTION_LIMIT)
+        async with aiohttp.ClientSession(connector=connector) as own_session:
+            async for batch in aiter_comment_batches(
+                target, video, results, key, session=own_session
+            ):
+                yield batch
+            return
 
-    response = request.execute()
-    comments = []
+    # The API caps pages at 100 items whatever maxResults says, so ask for
+    # full pages explicitly; plain text on every page keeps the schema
+    # consistent (the first page used to come back as HTML).
+    params = {
+        "part": target,
+        "videoId": video,
+        "maxResults": MAX_PAGE_SIZE,
+        "textFormat": "plainText",
+        "key": key,
+    }
+    response = await _afetch_page(session, params)
+    fetched = 0
     while response:
+        authors = []
+        published = []
+        updated = []
+        likes = []
+        texts = []
         for item in response["items"]:
             comment = item["snippet"]["topLevelComment"]["snippet"]
-            comments.append(
-                [
-                    comment["authorDisplayName"],
-                    comment["publishedAt"],
-                    comment["updatedAt"],
-                    comment["likeCount"],
-                    comment["textDisplay"],
-                ]
-            )
+            authors.append(comment["authorDisplayName"])
+            published.append(comment["publishedAt"])
+            updated.append(comment["updatedAt"])
+            likes.append(comment["likeCount"])
+            texts.append(comment["textDisplay"])
+
+        # Trim the final page so no more than 'results' comments are yielded.
+        remaining = results - fetched
+        if len(texts) > remaining:
+            authors = authors[:remaining]
+            published = published[:remaining]
+            updated = updated[:remaining]
+            likes = likes[:remaining]
+            texts = texts[:remaining]
+        fetched += len(texts)
+
+        yield {
+            "author": authors,
+            "published_at": published,
+            "updated_at": updated,
+            "likes": likes,
+            "text": texts,
+        }
+
+        if fetched >= results:
+            break
 
         if "nextPageToken" in response:
-            response = (
-                youtube.commentThreads()
-                .list(
-                    part=target,
-                    videoId=video,
-                    textFormat="plainText",
-                    pageToken=response["nextPageToken"],
-                )
-                .execute()
-            )
+            params = {
+                "part": target,
+                "videoId": video,
+                "maxResults": MAX_PAGE_SIZE,
+                "textFormat": "plainText",
+                "pageToken": response["nextPageToken"],
+                "key": key,
+            }
+            response = await _afetch_page(session, params)
         else:
             break
 
-    return comments
+
+def iter_comment_batches(target, video, results, key):
+    """
+    Yields one column dict of comments per commentThreads page.
+
+    Args:
+        target (str): The part parameter specifies a comma-separated list
+                      of commentThread resource properties.
+        video (str): The ID of the video for which the comments are fetched.
+        results (int): The maximum number of comments to retrieve.
+        key (str): The API key for authentication.
+
+    Yields:
+        dict: One list per column ('author', 'published_at', 'updated_at',
+              'likes', 'text') holding the comments of a single API page.
+
+    Note:
+        This is a synchronous bridge over 'aiter_comment_batches' for callers
+        without a running event loop; it drives the pages on a private loop.
+    """
+    loop = asyncio.new_event_loop()
+    batches = aiter_comment_batches(target, video, results, key)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(anext(batches))
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(batches.aclose())
+        loop.close()
+
+
+async def afetch_comments_from_videos(target, videos, results, key):
+    """
+    Asynchronously fetches comments for several videos at once.
+
+    Args:
+        target (str): The part parameter specifies a comma-separated list
+                      of commentThread resource properties.
+        videos (list): The IDs of the videos for which the comments are fetched.
+        results (int): The maximum number of comments to retrieve per video.
+        key (str): The API key for authentication.
+
+    Returns:
+        list: One column dict of comments per video, in the order of the input IDs.
+
+    Note:
+        All videos share a single session whose connection pool is bounded by
+        CONNECTION_LIMIT, so overlap stays within the API quota.
+    """
+    connector = aiohttp.TCPConnector(limit=CONNECTION_LIMIT)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await asyncio.gather(
+            *(
+                afetch_youtube_comments(target, video, results, key, session=session)
+                for video in videos
+            )
+        )
+
+
+def fetch_youtube_comments(target, video, results, key):
+    """
+    Fetches YouTube comments for a given video.
+
+    Args:
+        target (str): The part parameter specifies a comma-separated list
+                      of commentThread resource properties.
+        video (str): The ID of the video for which the comments are fetched.
+        results (int): The maximum number of comments to retrieve.
+        key (str): The API key for authentication.
+
+    Returns:
+        dict: One list per column ('author', 'published_at', 'updated_at',
+              'likes', 'text') covering every fetched comment.
+
+    Note:
+        This is a synchronous wrapper around 'afetch_youtube_comments' for
+        callers without a running event loop.
+    """
+    return asyncio.run(afetch_youtube_comments(target, video, results, key))
 
 
 def fetch_batch_data_from_video(vid, limit=3000):
@@ -118,34 +300,105 @@ def fetch_batch_data_from_video(vid, limit=3000):
             - 'text': Text content of the comment.
 
     Raises:
-        googleapiclient.errors.HttpError: If an HTTP error occurs during the API request.
+        aiohttp.ClientResponseError: If an HTTP error occurs during the API request.
 
     Note:
         This function utilizes the 'fetch_youtube_comments' function to retrieve comments
-        and creates a DataFrame with specified column names.
+        and builds the DataFrame column by column with explicit dtypes, so pandas
+        skips row-wise inference and parses the timestamps in one vectorised call.
     """
-    api_service_name = "youtube"
-    api_version = "v3"
     api_key = YOUTUBE_API_KEY
     col_names = ["author", "published_at", "updated_at", "likes", "text"]
 
     try:
+        columns = fetch_youtube_comments("snippet", vid, limit, api_key)
         ytb_df = pd.DataFrame(
-            fetch_youtube_comments(
-                "snippet", vid, limit, api_service_name, api_version, api_key
-            ),
-            columns=col_names,
+            {
+                "author": columns["author"],
+                "published_at": pd.to_datetime(
+                    columns["published_at"], utc=True, cache=True
+                ),
+                "updated_at": pd.to_datetime(
+                    columns["updated_at"], utc=True, cache=True
+                ),
+                "likes": np.asarray(columns["likes"], dtype=np.int32),
+                "text": columns["text"],
+            }
         )
         logging.info("Successfully fetched YouTube comments data.")
-    except googleapiclient.errors.HttpError as e:
+    except aiohttp.ClientResponseError as e:
         logging.error(
-            "Error %s occurred while fetching data:\n%s", e.resp.status, e.content
+            "Error %s occurred while fetching data:\n%s", e.status, e.message
         )
         ytb_df = pd.DataFrame(columns=col_names)
 
     return ytb_df
 
 
+def save_comments(df, output_file):
+    """
+    Saves the comments DataFrame, picking the backend from the file suffix.
+
+    Args:
+        df (pandas.DataFrame): The comments data to save.
+        output_file (str): Output file path; '.parquet' and '.feather' select
+                           the columnar pyarrow backends, anything else falls
+                           back to CSV.
+
+    Note:
+        The columnar formats round-trip much faster than CSV and preserve the
+        datetime and integer dtypes, so the preparation stage does not have to
+        re-infer them.
+    """
+    suffix = Path(output_file).suffix
+    if suffix == ".parquet":
+        df.to_parquet(output_file, engine="pyarrow", compression="zstd")
+    elif suffix == ".feather":
+        df.to_feather(output_file)
+    else:
+        df.to_csv(output_file)
+
+
+def stream_comments_to_parquet(vid, output_file, limit=3000):
+    """
+    Streams YouTube comments for a video straight into a Parquet file.
+
+    Args:
+        vid (str): The YouTube video ID for which comments data is collected.
+        output_file (str): Output file path for the Parquet data.
+        limit (int, optional): The maximum number of comments to retrieve. Defaults to 3000.
+
+    Note:
+        Each API page becomes one Parquet row group written through
+        'pyarrow.parquet.ParquetWriter', so peak memory stays at a single page
+        regardless of the limit instead of holding the full comment list.
+    """
+    writer = None
+    try:
+        for batch in iter_comment_batches("snippet", vid, limit, YOUTUBE_API_KEY):
+            table = pa.table(
+                {
+                    "author": batch["author"],
+                    "published_at": pd.to_datetime(
+                        batch["published_at"], utc=True, cache=True
+                    ),
+                    "updated_at": pd.to_datetime(
+                        batch["updated_at"], utc=True, cache=True
+                    ),
+                    "likes": np.asarray(batch["likes"], dtype=np.int32),
+                    "text": batch["text"],
+                }
+            )
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    output_file, table.schema, compression="zstd"
+                )
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
 @click.command()
 @click.option(
     "--video_id",
@@ -168,8 +421,11 @@ def main(video_id, output_file):
     - output_file (str): Output file path for storing comments data.
     """
     try:
-        ytb_df = fetch_batch_data_from_video(video_id)
-        ytb_df.to_csv(output_file)
+        if Path(output_file).suffix == ".parquet":
+            stream_comments_to_parquet(video_id, output_file)
+        else:
+            ytb_df = fetch_batch_data_from_video(video_id)
+            save_comments(ytb_df, output_file)
         logging.info("Successfully saved YouTube comments data to %s.", output_file)
     except Exception as e:
         logging.exception("An error occurred during data collection: %s", e)
@@ -7,17 +7,21 @@ It includes functions for cleaning HTML tags, translating emojis and emoticons,
 filtering text noise, removing stopwords, lemmatizing text, and performing sentiment analysis.
 
 Functions:
+    - parallel_map: Maps a function over a Series, sharding across processes.
     - save_corpus: Saves a processed DataFrame to a pickle file.
     - read_data: Reads data from a CSV file into a DataFrame.
     - remove_html_tags: Removes HTML tags from text.
     - translate_emojis: Translates Unicode emojis in text.
     - translate_emoticons: Translates emoticons in text.
+    - translate_emotions: Translates emojis and emoticons in one pass, reporting presence flags.
     - filter_text_noise: Removes non-alphabetic characters from text.
     - filter_stopwords: Removes stopwords from text.
     - lemmatize_text: Lemmatizes words in text.
+    - lemmatize_corpus: Lemmatizes a whole corpus, batched through spaCy when available.
     - get_sent_label: Returns sentiment label ('positive', 'neutral', 'negative') based on a text's 
       sentiment score.
     - get_sent_score: Returns the sentiment score of a text.
+    - get_sentiment: Returns the sentiment score and label from a single VADER pass.
     - has_emojis: Checks if a text contains emojis (returns 1 if true, 0 otherwise).
     - has_emoticons: Checks if a text contains emoticons (returns 1 if true, 0 otherwise).
     - main: Performs data preparation tasks for a text-based DataFrame.
@@ -28,7 +32,7 @@ Parameters:
 
 Note:
     To use the functions in this module, ensure you have the required libraries installed
-    (e.g., 'pandas', 'bs4', 'emot', 'nltk') and have the NLTK data downloaded (for stopwords
+    (e.g., 'pandas', 'emot', 'nltk') and have the NLTK data downloaded (for stopwords
     and lemmatization).
 
 Usage:
@@ -37,24 +41,123 @@ Usage:
         python your_module_name.py --input_file INPUT_FILE_PATH --output_file OUTPUT_FILE_PATH
 """
 import warnings
+import html
 import logging
+import multiprocessing
+import os
+import re
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 from emot import UNICODE_EMOJI, EMOTICONS_EMO
-from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 from nltk.stem.wordnet import WordNetLemmatizer
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 import click
 
 
-warnings.filterwarnings("ignore")
+# Silence only the noisy library deprecation chatter; anything else (e.g.
+# pandas PerformanceWarning) should stay visible.
+warnings.simplefilter("default")
+warnings.filterwarnings("ignore", category=FutureWarning)
+warnings.filterwarnings("ignore", category=DeprecationWarning)
 logging.basicConfig(level=logging.INFO)
 
 
 CURRENT_DIR = Path()
 
+# Runs of characters to blank out when cleaning comment text.
+_NOISE_RE = re.compile(r"[^A-Za-z]+")
+
+# Word tokenizer for already-cleaned comment text; NLTK's word_tokenize runs
+# Punkt sentence segmentation first, which is overkill here.
+_TOKENIZE = re.compile(r"[A-Za-z]+").findall
+
+
+class _CleanTable(dict):
+    """
+    Translate table that lowercases A-Z and maps any other non-letter
+    codepoint to a space, populated lazily so the Unicode range is never
+    materialised up front.
+    """
+
+    def __missing__(self, code):
+        if 65 <= code <= 90:  # A-Z
+            value = code + 32
+        elif 97 <= code <= 122:  # a-z
+            value = code
+        else:
+            value = 32  # space
+        self[code] = value
+        return value
+
+
+# Shared table so noise stripping and lowercasing happen in one linear scan.
+_CLEAN_TABLE = _CleanTable()
+
+# YouTube comment markup is flat (<a>, <br>, entity refs), so a tag regex
+# plus entity unescaping replaces a full BeautifulSoup parse.
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# The emoji/emoticon vocabularies are compiled into one alternation pattern
+# each, so every comment is scanned once instead of once per dictionary entry.
+# Longer patterns come first so multi-codepoint sequences win over prefixes.
+_EMOJI_MAP = {
+    emo: UNICODE_EMOJI[emo].replace(":", "").replace("_", " ")
+    for emo in UNICODE_EMOJI
+}
+_EMOJI_RE = re.compile(
+    "|".join(re.escape(emo) for emo in sorted(_EMOJI_MAP, key=len, reverse=True))
+)
+_EMOTICON_RE = re.compile(
+    "|".join(re.escape(emo) for emo in sorted(EMOTICONS_EMO, key=len, reverse=True))
+)
+
+# NLTK resources are loaded once at import time; instantiating them per call
+# would reload the VADER lexicon and stopword corpus for every comment. Worker
+# processes inherit these singletons through fork, so parallel_map shards pay
+# no extra loads either.
+_SENT_ANALYZER = SentimentIntensityAnalyzer()
+_STOPWORDS = frozenset(stopwords.words("english"))
+_LEMMATIZER = WordNetLemmatizer()
+
+# Frames smaller than this are not worth the process spawn overhead.
+_MIN_PARALLEL_ROWS = 1000
+
+
+def _map_chunk(args):
+    """Maps a function over one Series shard inside a worker process."""
+    func, chunk = args
+    return chunk.map(func)
+
+
+def parallel_map(func, series, n_workers=None):
+    """
+    Maps a function over a Series, sharding across processes for large frames.
+
+    Args:
+        func (callable): A picklable, module-level function applied per value.
+        series (pandas.Series): The values to transform.
+        n_workers (int, optional): Number of worker processes. Defaults to the
+                                   CPU count.
+
+    Returns:
+        pandas.Series: The mapped values, with the original index preserved.
+
+    Note:
+        Rows are independent, so the Series is split into one shard per worker
+        and the results are concatenated back in order. Small frames fall back
+        to a plain Series.map to avoid the process start-up cost.
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if n_workers <= 1 or len(series) < _MIN_PARALLEL_ROWS:
+        return series.map(func)
+    chunks = np.array_split(series, n_workers)
+    with multiprocessing.Pool(n_workers) as pool:
+        results = pool.map(_map_chunk, [(func, chunk) for chunk in chunks])
+    return pd.concat(results)
+
 
 def save_corpus(df, fdir=CURRENT_DIR, fname="corpus.pkl"):
     """Saves a Corpus DataFrame to a pickle file."""
@@ -63,64 +166,130 @@ def save_corpus(df, fdir=CURRENT_DIR, fname="corpus.pkl"):
 
 
 def read_data(fname, fdir=CURRENT_DIR):
-    """Reads data from a CSV file into a DataFrame."""
-    data = pd.read_csv(fdir / fname)
+    """Reads raw comments data into a DataFrame, picking the backend from the file suffix."""
+    path = fdir / fname
+    suffix = Path(fname).suffix
+    if suffix == ".parquet":
+        data = pd.read_parquet(path, engine="pyarrow")
+    elif suffix == ".feather":
+        data = pd.read_feather(path)
+    else:
+        data = pd.read_csv(path)
     return data
 
 
 def remove_html_tags(text):
     """Removes HTML tags from text."""
-    soup = BeautifulSoup(text, "html.parser")
-    return soup.get_text()
+    return html.unescape(_TAG_RE.sub("", text))
 
 
 def translate_emojis(text):
     """Translates Unicode emojis in text."""
-    tokenized_text = word_tokenize(text)
-    for emo in UNICODE_EMOJI:
-        if emo in tokenized_text:
-            emo_index = tokenized_text.index(emo)
-            tokenized_text[emo_index] = (
-                UNICODE_EMOJI[emo].replace(":", "").replace("_", " ")
-            )
-    return " ".join(tokenized_text)
+    return _EMOJI_RE.sub(lambda m: " " + _EMOJI_MAP[m.group(0)] + " ", text)
 
 
 def translate_emoticons(text):
     """Translates emoticons in text."""
-    new_text = text
-    for ticon in EMOTICONS_EMO:
-        if ticon in new_text:
-            new_text = new_text.replace(ticon, EMOTICONS_EMO[ticon])
-    return new_text
+    return _EMOTICON_RE.sub(lambda m: EMOTICONS_EMO[m.group(0)], text)
+
+
+def translate_emotions(text):
+    """
+    Translates emojis and emoticons in text in a single pass, also reporting
+    whether each kind was present.
+
+    Args:
+        text (str): The input text to translate.
+
+    Returns:
+        tuple: The translated text, a 0/1 emoji flag and a 0/1 emoticon flag.
+
+    Note:
+        The flags fall out of the substitution counts, so the 'has_emojis' and
+        'has_emoticons' columns cost no extra scan over the text.
+    """
+    translated, n_emojis = _EMOJI_RE.subn(
+        lambda m: " " + _EMOJI_MAP[m.group(0)] + " ", text
+    )
+    translated, n_emoticons = _EMOTICON_RE.subn(
+        lambda m: EMOTICONS_EMO[m.group(0)], translated
+    )
+    return translated, int(n_emojis > 0), int(n_emoticons > 0)
+
+
+def _clean_raw_text(text):
+    """Strips HTML then translates emojis/emoticons, returning text and flags."""
+    return translate_emotions(remove_html_tags(text))
+
+
+# spaCy pipeline loaded on first use; False marks a failed load so it is only
+# attempted once.
+_SPACY_MODEL = "en_core_web_sm"
+_NLP = None
+
+
+def _get_spacy():
+    """Loads the spaCy pipeline once; returns None when spaCy or the model is missing."""
+    global _NLP
+    if _NLP is None:
+        try:
+            import spacy
+
+            _NLP = spacy.load(_SPACY_MODEL, disable=["parser", "ner"])
+        except (ImportError, OSError):
+            _NLP = False
+    return _NLP or None
+
+
+def lemmatize_corpus(cleaned, filtered):
+    """
+    Lemmatizes a whole corpus of cleaned texts.
+
+    Args:
+        cleaned (pandas.Series): The cleaned comment texts.
+        filtered (pandas.Series): The same texts with stopwords removed.
+
+    Returns:
+        pandas.Series: One string of space-joined lemmas per comment.
+
+    Note:
+        When the spaCy 'en_core_web_sm' model is available the texts are run
+        through 'nlp.pipe' in multi-process batches, with stopword dropping
+        folded into the same pass and POS-aware lemmas. Otherwise the rows
+        fall back to the WordNet lemmatizer over the pre-filtered texts.
+    """
+    nlp = _get_spacy()
+    if nlp is None:
+        return parallel_map(lemmatize_text, filtered)
+    return pd.Series(
+        [
+            " ".join(token.lemma_ for token in doc if not token.is_stop)
+            for doc in nlp.pipe(cleaned, batch_size=512, n_process=-1)
+        ],
+        index=cleaned.index,
+    )
 
 
 def filter_text_noise(text):
     """Removes non-alphabetic characters from text."""
-    next_text = text
-    for e in next_text:
-        if not e.isalpha():
-            next_text = next_text.replace(e, " ")
-    return next_text
+    return _NOISE_RE.sub(" ", text)
 
 
 
 def filter_stopwords(text):
     """Removes stopwords from text."""
-    stop_words = set(stopwords.words("english"))
-    tokenized_text = word_tokenize(text)
+    tokenized_text = _TOKENIZE(text)
     filtered_text = []
     for token in tokenized_text:
-        if token not in stop_words:
+        if token not in _STOPWORDS:
             filtered_text.append(token)
     return " ".join(filtered_text)
 
 
 def lemmatize_text(text):
     """Lemmatizes words in text."""
-    lemmatizer = WordNetLemmatizer()
-    tokenized_text = word_tokenize(text)
-    return " ".join([lemmatizer.lemmatize(w) for w in tokenized_text])
+    tokenized_text = _TOKENIZE(text)
+    return " ".join([_LEMMATIZER.lemmatize(w) for w in tokenized_text])
 
 
 def get_sent_label(text="", score=None):
@@ -145,9 +314,8 @@ def get_sent_label(text="", score=None):
         >>> get_sent_label("This is a positive statement.")
         'positive'
     """
-    sent_analyzer = SentimentIntensityAnalyzer()
-    if not score:
-        score = sent_analyzer.polarity_scores(text)["compound"]
+    if score is None:
+        score = _SENT_ANALYZER.polarity_scores(text)["compound"]
     if 0.4 < score:
         return "positive"
     if -0.1 < score <= 0.4:
@@ -174,27 +342,38 @@ def get_sent_score(text):
         >>> get_sent_score("This is a positive statement.")
         0.6369
     """
-    sent_analyzer = SentimentIntensityAnalyzer()
-    score = sent_analyzer.polarity_scores(text)["compound"]
+    score = _SENT_ANALYZER.polarity_scores(text)["compound"]
     return score
 
 
+def get_sentiment(text):
+    """
+    Returns the sentiment score and label of a text from a single VADER pass.
+
+    Args:
+        text (str): The input text for sentiment analysis.
+
+    Returns:
+        tuple: The compound sentiment score and its 'positive'/'neutral'/
+               'negative' label.
+
+    Note:
+        Scoring a text and labelling it separately would run
+        'polarity_scores' twice; this helper computes the score once and
+        derives the label from it.
+    """
+    score = _SENT_ANALYZER.polarity_scores(text)["compound"]
+    return score, get_sent_label(score=score)
+
+
 def has_emojis(text):
     """Checks if a text contains emojis (returns 1 if true, 0 otherwise)."""
-    tokenized_text = word_tokenize(text)
-    for emo in UNICODE_EMOJI:
-        if emo in tokenized_text:
-            return 1
-    return 0
+    return 1 if _EMOJI_RE.search(text) else 0
 
 
 def has_emoticons(text):
     """Checks if a text contains emoticons (returns 1 if true, 0 otherwise)."""
-    new_text = text
-    for ticon in EMOTICONS_EMO:
-        if ticon in new_text:
-            return 1
-    return 0
+    return 1 if _EMOTICON_RE.search(text) else 0
 
 
 @click.command()
@@ -220,17 +399,38 @@ def main(input_file, output_file):
     """
     try:
         df = read_data(input_file)
-        df["cleaned_text"] = df.text.apply(lambda t: remove_html_tags(t))
-        df["cleaned_text"] = df.cleaned_text.apply(lambda t: translate_emojis(t))
-        df["cleaned_text"] = df.cleaned_text.apply(lambda t: translate_emoticons(t))
-        df["cleaned_text"] = df.cleaned_text.apply(lambda t: filter_text_noise(t))
-        df["cleaned_text"] = df.cleaned_text.str.lower()
-        df["filtered_text"] = df.cleaned_text.apply(lambda t: filter_stopwords(t))
-        df["lemmatized_text"] = df.filtered_text.apply(lambda t: lemmatize_text(t))
-        df["has_emojis"] = df.text.apply(lambda t: has_emojis(t))
-        df["has_emoticons"] = df.text.apply(lambda t: has_emoticons(t))
-        df["sent_class"] = df.cleaned_text.apply(lambda t: get_sent_label(t))
-        df["sent_score"] = df.cleaned_text.apply(lambda t: get_sent_score(t))
+        # Spam and copy-paste make identical comments common, so the NLP
+        # stages only run on the unique texts and the results are mapped back.
+        uniq = df["text"].drop_duplicates()
+        emotions = parallel_map(_clean_raw_text, uniq)
+        cleaned = pd.Series(
+            [emo[0] for emo in emotions], index=uniq.index
+        ).str.translate(_CLEAN_TABLE)
+        filtered = parallel_map(filter_stopwords, cleaned)
+        lemmatized = lemmatize_corpus(cleaned, filtered)
+        sentiments = parallel_map(get_sentiment, cleaned)
+
+        df["cleaned_text"] = df["text"].map(dict(zip(uniq, cleaned)))
+        df["filtered_text"] = df["text"].map(dict(zip(uniq, filtered)))
+        df["lemmatized_text"] = df["text"].map(dict(zip(uniq, lemmatized)))
+        df["has_emojis"] = (
+            df["text"]
+            .map(dict(zip(uniq, (emo[1] for emo in emotions))))
+            .astype(np.int8)
+        )
+        df["has_emoticons"] = (
+            df["text"]
+            .map(dict(zip(uniq, (emo[2] for emo in emotions))))
+            .astype(np.int8)
+        )
+        df[["sent_score", "sent_class"]] = pd.DataFrame(
+            df["text"].map(dict(zip(uniq, sentiments))).tolist(), index=df.index
+        )
+        # Three repeated labels compress to int8 codes as a Categorical, which
+        # also speeds up downstream value_counts/groupby and serialisation.
+        df["sent_class"] = pd.Categorical(
+            df["sent_class"], categories=["negative", "neutral", "positive"]
+        )
         save_corpus(df=df, fname=output_file)
         logging.info("Successfully processed corpus data")
     except Exception as e:
@@ -7,6 +7,7 @@ including sentiment proportion charts, top viewer sentiment extraction, word clo
 for top commenters, and engagement curve plotting.
 
 Functions:
+    - read_corpus: Reads a corpus DataFrame, picking the reader from the file suffix.
     - save_sentiment_ratio: Graphs a pie chart of sentiment categories.
     - save_top_viewer: Extracts and saves data related to the top viewer from the given DataFrame.
     - save_topics_from_top_viewers: Generates and saves a word cloud representing common topics
@@ -25,27 +26,95 @@ from pathlib import Path
 import logging
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from wordcloud import WordCloud, STOPWORDS
-from sklearn.preprocessing import MinMaxScaler
 import click
 
-warnings.filterwarnings("ignore")
+# Silence only the noisy library deprecation chatter; anything else (e.g.
+# pandas PerformanceWarning) should stay visible.
+warnings.simplefilter("default")
+warnings.filterwarnings("ignore", category=FutureWarning)
+warnings.filterwarnings("ignore", category=DeprecationWarning)
 np.set_printoptions(precision=4)
-sns.set_theme()
 logging.basicConfig(level=logging.INFO)
 
 CURRENT_DIR = Path()
 
+# matplotlib/seaborn and wordcloud together take seconds to import, so they
+# are loaded on first use; --help and runs that skip a plot never pay for
+# them.
+_PLT = None
+_STOPWORD_LIST = None
+
+
+def _load_pyplot():
+    """Imports matplotlib and seaborn on first use and returns pyplot."""
+    global _PLT
+    if _PLT is None:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        sns.set_theme()
+        _PLT = plt
+    return _PLT
+
+
+def _get_stopword_list():
+    """Builds the word-cloud stopword set once, importing wordcloud lazily."""
+    global _STOPWORD_LIST
+    if _STOPWORD_LIST is None:
+        from wordcloud import STOPWORDS
+
+        _STOPWORD_LIST = frozenset(STOPWORDS)
+    return _STOPWORD_LIST
+
+
+def _min_max_scale(values):
+    """Scales an array to [0, 1], mapping a constant column to zeros like MinMaxScaler."""
+    rng = values.max() - values.min()
+    if not rng:
+        return np.zeros_like(values)
+    return (values - values.min()) / rng
+
+
+def read_corpus(input_file, columns=None):
+    """
+    Reads a corpus DataFrame, picking the reader from the file suffix.
+
+    Args:
+        input_file (str): Input file path; '.feather' and '.parquet' use the
+                          columnar readers, anything else is treated as pickle.
+        columns (list, optional): Columns to load. The columnar formats read
+                                  only these from disk; pickle loads the full
+                                  frame first and then drops the rest.
+
+    Returns:
+        pandas.DataFrame: The loaded corpus data.
+    """
+    path = CURRENT_DIR / input_file
+    suffix = Path(input_file).suffix
+    if suffix == ".feather":
+        return pd.read_feather(path, columns=columns)
+    if suffix == ".parquet":
+        return pd.read_parquet(path, columns=columns)
+    corpus = pd.read_pickle(path)
+    if columns is not None:
+        corpus = corpus[columns]
+    return corpus
+
 
 def save_sentiment_ratio(df, fname, viewer=None):
     """Graph a pie chart of sentiment categories"""
+    plt = _load_pyplot()
     if viewer:
         plt.title(f"Ratio Chart of {viewer} Sentiments")
     else:
         plt.title("Ratio Chart of Sentiments")
-    df["sent_class"].value_counts(normalize=True).plot.pie(autopct="%1.0f%%")
+    # The preparation stage writes sent_class as a Categorical; older pickled
+    # corpora carry plain strings, so convert before counting — value_counts
+    # over int8 codes beats hashing a Python string per row.
+    sent_classes = df["sent_class"]
+    if sent_classes.dtype != "category":
+        sent_classes = sent_classes.astype("category")
+    sent_classes.value_counts(normalize=True).plot.pie(autopct="%1.0f%%")
     plt.savefig(CURRENT_DIR / fname)
     logging.info(f"Saved sentiment ratio chart to {CURRENT_DIR / fname}")
 
@@ -61,10 +130,13 @@ def save_top_viewer(df, fname):
     Note:
         The function calculates the top viewer based on the 'author' column in the DataFrame.
         It then extracts data related to the top viewer and saves the sentiment ratio using
-        the 'save_sentiment_ratio' function.
+        the 'save_sentiment_ratio' function. The most frequent author comes from
+        value_counts rather than describe(), which computes unused summary
+        statistics, and the rows are pulled through the groupby indices instead
+        of a boolean-mask copy.
     """
-    top_viewer = df["author"].describe()["top"]
-    top_viewer_data = df[df["author"] == top_viewer]
+    top_viewer = df["author"].value_counts(sort=True).index[0]
+    top_viewer_data = df.groupby("author", sort=False).get_group(top_viewer)
     save_sentiment_ratio(top_viewer_data, fname, viewer=top_viewer)
 
 
@@ -86,26 +158,30 @@ def save_topics_from_top_viewers(df, n_viewers, fname):
         based on the number of likes in the DataFrame. It then generates a word cloud
         visualization using the 'WordCloud' library and saves the image file.
     """
+    from wordcloud import WordCloud
+
+    plt = _load_pyplot()
     n_commenters = int(n_viewers)
-    top_n_commenters_content = (
-        df.sort_values(by="likes", ascending=False).head(n_commenters).lemmatized_text
-    )
-    top_terms = "".join([item for item in top_n_commenters_content])
-    stopword_list = set(STOPWORDS)
+    # nlargest partially selects the top rows in O(N) instead of fully
+    # sorting the frame.
+    top_n_commenters_content = df.nlargest(n_commenters, "likes").lemmatized_text
+    # str.cat with a space separator also fixes the old "".join, which glued
+    # the last and first words of adjacent comments together.
+    top_terms = top_n_commenters_content.str.cat(sep=" ")
 
     word_cloud = WordCloud(
         width=550,
         height=550,
         background_color="white",
-        stopwords=stopword_list,
+        stopwords=_get_stopword_list(),
         min_font_size=10,
     ).generate(top_terms)
 
     plt.figure(figsize=(10, 8))
     plt.title(f"WordCloud of Top {n_commenters} Liked Comments")
-    plt.imshow(word_cloud)
+    plt.imshow(word_cloud, rasterized=True)
     plt.axis("off")
-    plt.savefig(CURRENT_DIR / fname)
+    plt.savefig(CURRENT_DIR / fname, dpi=150)
     logging.info(
         f"Saved word cloud of top {n_commenters} liked comments to {CURRENT_DIR / fname}"
     )
@@ -124,44 +200,55 @@ def save_engagement_curve(df, fname):
         None
 
     Note:
-        The function converts the 'published_at' column to datetime format and groups the
-        data by date.
-        It then calculates the sum of likes and the total number of comments for each date.
-        The engagement values are normalized using MinMaxScaler and plotted over time.
+        The function floors the 'published_at' timestamps to datetime64 day
+        codes and groups on those directly — '.dt.date' would create one
+        Python date object per row and force an object-dtype group key. It
+        then calculates the sum of likes and the total number of comments for
+        each date. The engagement values are min-max normalized with plain
+        NumPy reductions and plotted over time.
     """
-    corpus = df.copy()
-    corpus.published_at = pd.to_datetime(corpus.published_at)
-    n_comments_over_time = corpus.groupby(corpus["published_at"].dt.date).agg(
-        {"likes": "sum", "published_at": "size"}
-    )
-    scaler = MinMaxScaler()
-    normalized_comments_over_time = n_comments_over_time.copy()
-    normalized_comments_over_time[["published_at", "likes"]] = scaler.fit_transform(
-        normalized_comments_over_time
+    plt = _load_pyplot()
+    engagement = (
+        pd.DataFrame(
+            {
+                "day": pd.to_datetime(df["published_at"]).values.astype(
+                    "datetime64[D]"
+                ),
+                "likes": df["likes"].to_numpy(),
+            }
+        )
+        .groupby("day", sort=True)
+        .agg(likes=("likes", "sum"), n_comments=("likes", "size"))
     )
+    likes = _min_max_scale(engagement["likes"].to_numpy(float))
+    n_comments = _min_max_scale(engagement["n_comments"].to_numpy(float))
     plt.figure(figsize=(10, 5))
     plt.plot(
-        normalized_comments_over_time.index,
-        normalized_comments_over_time.published_at,
+        engagement.index,
+        n_comments,
         marker="o",
         linestyle="-",
         color="b",
         label="Comments",
+        rasterized=True,
     )
     plt.plot(
-        normalized_comments_over_time.index,
-        normalized_comments_over_time.likes,
+        engagement.index,
+        likes,
         marker="+",
         linestyle="-",
         color="r",
         label="Likes",
+        rasterized=True,
     )
     plt.title("Engagement Curve")
     plt.xlabel("Months")
     plt.ylabel("Number of Likes and Comments")
     plt.legend()
     plt.grid(True)
-    plt.savefig(CURRENT_DIR / fname)
+    # Rasterized lines keep axes and labels vector while the many daily
+    # points ship as a small bitmap instead of thousands of paths.
+    plt.savefig(CURRENT_DIR / fname, dpi=150)
     logging.info(f"Saved engagement curve to {CURRENT_DIR / fname}")
 
 
@@ -219,7 +306,18 @@ def main(sentiment, top_viewer, top_viewer_topics, engagement, input_file, outpu
         based on the specified options. It uses functions like 'save_sentiment_ratio',
         'save_top_viewer', 'save_topics_from_top_viewers', and 'save_engagement_curve'.
     """
-    corpus = pd.read_pickle(CURRENT_DIR / input_file)
+    # Each visualization touches only a column or two, so only those are
+    # loaded (pushed down to disk for the columnar formats).
+    needed = set()
+    if sentiment:
+        needed.add("sent_class")
+    if top_viewer:
+        needed |= {"author", "sent_class"}
+    if top_viewer_topics:
+        needed |= {"likes", "lemmatized_text"}
+    if engagement:
+        needed |= {"published_at", "likes"}
+    corpus = read_corpus(input_file, columns=sorted(needed) if needed else None)
     try:
         if sentiment:
             save_sentiment_ratio(corpus, output_file)
@@ -12,64 +12,144 @@ Functions:
     - filter_text_noise: Removes non-alphabetic characters from text.
     - filter_stopwords: Removes stopwords from text.
     - lemmatize_text: Lemmatizes words in text.
+    - clean_corpus: Cleans a whole Series of comments column-wise.
+    - clean_corpus_parallel: Cleans a whole Series of comments across worker processes.
 """
 
+import html
+import os
+import re
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
 from bs4 import BeautifulSoup
 from emot import UNICODE_EMOJI, EMOTICONS_EMO
-from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 from nltk.stem.wordnet import WordNetLemmatizer
 
 
-def remove_html_tags(text):
-    """Removes HTML tags from text."""
-    soup = BeautifulSoup(text, "html.parser")
-    return soup.get_text()
+# Runs of characters to blank out when removing text noise.
+_NON_ALPHA = re.compile(r"[^A-Za-z]+")
+
+# YouTube comment markup is flat (<a>, <br>, entity refs), so a tag regex
+# covers the batched cleaning path without building a parse tree per row.
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Lightweight word tokenizer; NLTK's word_tokenize runs Punkt sentence
+# segmentation first, which is overkill for comment text.
+_TOKENIZE = re.compile(r"\w+").findall
+
+# NLTK resources built once at import; constructing them per call walks the
+# corpus loader for every comment.
+_STOPWORDS = frozenset(stopwords.words("english"))
+_LEMMATIZER = WordNetLemmatizer()
+
+# Each vocabulary compiled into one alternation pattern so a comment is
+# scanned once instead of once per dictionary entry; longer patterns first so
+# multi-codepoint sequences win over their prefixes.
+_EMOJI_MAP = {
+    emo: UNICODE_EMOJI[emo].replace(":", "").replace("_", " ")
+    for emo in UNICODE_EMOJI
+}
+_EMOJI_RE = re.compile(
+    "|".join(re.escape(emo) for emo in sorted(_EMOJI_MAP, key=len, reverse=True))
+)
+_EMOTICON_RE = re.compile(
+    "|".join(re.escape(emo) for emo in sorted(EMOTICONS_EMO, key=len, reverse=True))
+)
+
+
+def remove_html_tags(text, use_bs4=False):
+    """
+    Removes HTML tags from text.
+
+    YouTube comment markup is short and flat, so the default path strips tags
+    with a compiled regex and decodes entities with html.unescape instead of
+    building a BeautifulSoup parse tree per call. Pass use_bs4=True for
+    markup that genuinely needs parsing.
+    """
+    if use_bs4:
+        soup = BeautifulSoup(text, "html.parser")
+        return soup.get_text()
+    return html.unescape(_TAG_RE.sub("", text))
 
 
 def translate_emojis(text):
     """Translates Unicode emojis in text."""
-    tokenized_text = word_tokenize(text)
-    for emo in UNICODE_EMOJI:
-        if emo in tokenized_text:
-            emo_index = tokenized_text.index(emo)
-            tokenized_text[emo_index] = (
-                UNICODE_EMOJI[emo].replace(":", "").replace("_", " ")
-            )
-    return " ".join(tokenized_text)
+    return _EMOJI_RE.sub(lambda m: " " + _EMOJI_MAP[m.group(0)] + " ", text)
 
 
 def translate_emoticons(text):
     """Translates emoticons in text."""
-    new_text = text
-    for ticon in EMOTICONS_EMO:
-        if ticon in new_text:
-            new_text = new_text.replace(ticon, EMOTICONS_EMO[ticon])
-    return new_text
+    return _EMOTICON_RE.sub(lambda m: EMOTICONS_EMO[m.group(0)], text)
 
 
 def filter_text_noise(text):
     """Removes non-alphabetic characters from text."""
-    next_text = text
-    for e in next_text:
-        if not e.isalpha():
-            next_text = next_text.replace(e, " ")
-    return next_text
+    return _NON_ALPHA.sub(" ", text)
 
 
 def filter_stopwords(text):
     """Removes stopwords from text."""
-    stop_words = set(stopwords.words("english"))
-    tokenized_text = word_tokenize(text)
+    tokenized_text = _TOKENIZE(text)
     filtered_text = []
     for token in tokenized_text:
-        if token not in stop_words:
+        if token not in _STOPWORDS:
             filtered_text.append(token)
     return " ".join(filtered_text)
 
 
 def lemmatize_text(text):
     """Lemmatizes words in text."""
-    lemmatizer = WordNetLemmatizer()
-    tokenized_text = word_tokenize(text)
-    return " ".join([lemmatizer.lemmatize(w) for w in tokenized_text])
+    tokenized_text = _TOKENIZE(text)
+    return " ".join([_LEMMATIZER.lemmatize(w) for w in tokenized_text])
+
+
+def _tokenize_stop_lemma(text):
+    """Drops stopwords and lemmatizes in a single tokenization pass."""
+    return " ".join(
+        _LEMMATIZER.lemmatize(token)
+        for token in _TOKENIZE(text)
+        if token not in _STOPWORDS
+    )
+
+
+def clean_corpus(series):
+    """
+    Cleans a whole Series of comments column-wise.
+
+    Runs the same stages as the row-wise helpers — HTML tag removal, emoji and
+    emoticon translation, noise filtering, lowercasing, stopword removal and
+    lemmatization — as chained Series operations, so compiled patterns and
+    NLTK resources are shared across the column instead of paid per comment.
+    """
+    cleaned = (
+        series.str.replace(_TAG_RE, " ", regex=True)
+        .map(html.unescape)
+        .map(translate_emojis)
+        .map(translate_emoticons)
+        .str.replace(_NON_ALPHA, " ", regex=True)
+        .str.lower()
+    )
+    return cleaned.map(_tokenize_stop_lemma)
+
+
+def clean_corpus_parallel(series, n_jobs=-1):
+    """
+    Cleans a whole Series of comments across worker processes.
+
+    Rows are independent, so the Series is split into one chunk per worker,
+    each chunk is cleaned with 'clean_corpus' and the results are
+    concatenated back in order. Every worker imports this module once, so the
+    compiled patterns and NLTK singletons are paid once per process rather
+    than per comment.
+    """
+    n_workers = os.cpu_count() or 1 if n_jobs == -1 else n_jobs
+    if n_workers <= 1:
+        return clean_corpus(series)
+    chunks = np.array_split(series, n_workers)
+    results = Parallel(n_jobs=n_jobs, batch_size="auto")(
+        delayed(clean_corpus)(chunk) for chunk in chunks
+    )
+    return pd.concat(results)
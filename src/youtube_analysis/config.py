@@ -11,20 +11,22 @@ Variables:
     - YOUTUBE_API_KEY (str): YouTube API key loaded from the environment variables.
 
 Raises:
-    - Exception: Raised if the '.env' file is not found or does not contain the required 
+    - RuntimeError: Raised if the environment does not provide the required
       YouTube API key.
 
 Note:
-    To use this module, ensure you have a '.env' file in the project root with the YouTube API key.
+    To use this module, ensure you have a '.env' file in the project root with the YouTube API key,
+    or export YOUTUBE_API_KEY directly (e.g. from the container environment).
 """
 import os
 from dotenv import load_dotenv
 
 
-# load key-value pairs from .env file located in the current directory
-load_dotenv(".env")
+# load key-value pairs from .env file located in the current directory; when
+# the variables come straight from the environment there is no file to parse
+if os.path.exists(".env"):
+    load_dotenv(".env")
 
-try:
-    YOUTUBE_API_KEY = os.environ["YOUTUBE_API_KEY"]
-except:
-    raise Exception("Create an .env file on the project root with the YOUTUBE_API_KEY")
+YOUTUBE_API_KEY = os.environ.get("YOUTUBE_API_KEY")
+if not YOUTUBE_API_KEY:
+    raise RuntimeError("Create an .env file on the project root with the YOUTUBE_API_KEY")
@@ -6,6 +6,7 @@ from a specified video. It uses the 'googleapiclient.discovery' library for buil
 the API service.
 
 Functions:
+    - afetch_youtube_comments: Asynchronously fetches YouTube comments for a given video.
     - fetch_youtube_comments: Fetches YouTube comments for a given video.
 
 Note:
@@ -21,16 +22,152 @@ Example:
         target='snippet',
         video='your_video_id',
         results=10,
-        service='youtube',
-        version='v3',
         key='your_api_key'
     )
 """
 
+import functools
+
+import aiohttp
+import httplib2
 import googleapiclient.discovery
 
 
-def fetch_youtube_comments(target, video, results, service, version, key):
+API_SERVICE_NAME = "youtube"
+API_VERSION = "v3"
+
+COMMENT_THREADS_URL = "https://www.googleapis.com/youtube/v3/commentThreads"
+
+# Upper bound on simultaneous connections to the API.
+CONNECTION_LIMIT = 20
+
+# Largest page size the commentThreads endpoint will actually serve.
+MAX_PAGE_SIZE = 100
+
+REQUEST_TIMEOUT = 10
+
+# Shared keep-alive transport so paginated requests reuse one TLS connection
+# instead of paying the handshake per page.
+_HTTP = httplib2.Http(timeout=REQUEST_TIMEOUT)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_service(key):
+    """Builds the YouTube API service once and reuses it across calls."""
+    return googleapiclient.discovery.build(
+        API_SERVICE_NAME,
+        API_VERSION,
+        developerKey=key,
+        http=_HTTP,
+        static_discovery=True,
+        cache_discovery=False,
+    )
+
+
+def _empty_columns():
+    """Returns fresh accumulator lists, one per comment column."""
+    return {
+        "author": [],
+        "published_at": [],
+        "updated_at": [],
+        "likes": [],
+        "text": [],
+    }
+
+
+def _extend_columns(columns, items):
+    """Appends the comments of one API page to the column accumulators."""
+    for item in items:
+        comment = item["snippet"]["topLevelComment"]["snippet"]
+        columns["author"].append(comment["authorDisplayName"])
+        columns["published_at"].append(comment["publishedAt"])
+        columns["updated_at"].append(comment["updatedAt"])
+        columns["likes"].append(comment["likeCount"])
+        columns["text"].append(comment["textDisplay"])
+
+
+def _truncate_columns(columns, limit):
+    """Trims the column accumulators to at most limit comments."""
+    for values in columns.values():
+        del values[limit:]
+
+
+async def _afetch_page(session, params):
+    """Fetches a single commentThreads page and returns the decoded JSON response."""
+    async with session.get(COMMENT_THREADS_URL, params=params) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def afetch_youtube_comments(target, video, results, key, session=None):
+    """
+    Asynchronously fetches YouTube comments for a given video.
+
+    Args:
+        target (str): The part parameter specifies a comma-separated list
+                      of commentThread resource properties.
+        video (str): The ID of the video for which the comments are fetched.
+        results (int): The maximum number of comments to retrieve.
+        key (str): The API key for authentication.
+        session (aiohttp.ClientSession, optional): An open session to reuse
+                                                   across requests. A temporary
+                                                   one is created when omitted.
+
+    Returns:
+        dict: One list per column ('author', 'published_at', 'updated_at',
+              'likes', 'text'), each holding the values for every fetched
+              comment in page order.
+
+    Raises:
+        aiohttp.ClientResponseError: If the API responds with an error status.
+
+    Note:
+        This variant talks to the commentThreads REST endpoint directly.
+        Pages of a single video are chained through 'nextPageToken', so they
+        are fetched in order; concurrency comes from callers with a running
+        event loop fetching several videos at once over one shared session.
+        Every page asks for the full 100 items in plain text, matching the
+        collection script.
+    """
+    if session is None:
+        connector = aiohttp.TCPConnector(limit=CONNECTION_LIMIT)
+        async with aiohttp.ClientSession(connector=connector) as own_session:
+            return await afetch_youtube_comments(
+                target, video, results, key, session=own_session
+            )
+
+    params = {
+        "part": target,
+        "videoId": video,
+        "maxResults": MAX_PAGE_SIZE,
+        "textFormat": "plainText",
+        "key": key,
+    }
+    response = await _afetch_page(session, params)
+    columns = _empty_columns()
+    while response:
+        _extend_columns(columns, response["items"])
+        if len(columns["text"]) >= results:
+            _truncate_columns(columns, results)
+            break
+
+        if "nextPageToken" in response:
+            params = {
+                "part": target,
+                "videoId": video,
+                "maxResults": MAX_PAGE_SIZE,
+                "textFormat": "plainText",
+                "pageToken": response["nextPageToken"],
+                "key": key,
+            }
+            response = await _afetch_page(session, params)
+        else:
+            break
+
+    return columns
+
+
+def fetch_youtube_comments(target, video, results, key):
     """
     Fetches YouTube comments for a given video.
 
@@ -39,55 +176,40 @@ def fetch_youtube_comments(target, video, results, service, version, key):
                       of commentThread resource properties.
         video (str): The ID of the video for which the comments are fetched.
         results (int): The maximum number of comments to retrieve.
-        service (str): The API service to use for fetching comments.
-        version (str): The API version to use.
         key (str): The API key for authentication.
 
     Returns:
-        list: A list containing information about each comment, including
-              author name, publication date, update date, like count,
-              and comment text.
+        dict: One list per column ('author', 'published_at', 'updated_at',
+              'likes', 'text'), each holding the values for every fetched
+              comment in page order.
 
     Raises:
         Any exceptions raised during the API request.
 
     Note:
         This function uses the YouTube API to fetch comments and may require
-        appropriate API credentials.
+        appropriate API credentials. The API service is built once and cached,
+        so repeated calls skip the discovery round-trip. Values are
+        accumulated per column so a DataFrame (or typed arrays) can be built
+        without row-wise dtype inference or an extra copy.
     """
-    youtube = googleapiclient.discovery.build(service, version, developerKey=key)
+    comment_threads = _get_service(key).commentThreads()
 
-    request = youtube.commentThreads().list(
-        part=target, videoId=video, maxResults=results
-    )
+    request = comment_threads.list(part=target, videoId=video, maxResults=results)
 
     response = request.execute()
-    comments = []
+    columns = _empty_columns()
     while response:
-        for item in response["items"]:
-            comment = item["snippet"]["topLevelComment"]["snippet"]
-            comments.append(
-                [
-                    comment["authorDisplayName"],
-                    comment["publishedAt"],
-                    comment["updatedAt"],
-                    comment["likeCount"],
-                    comment["textDisplay"],
-                ]
-            )
+        _extend_columns(columns, response["items"])
 
         if "nextPageToken" in response:
-            response = (
-                youtube.commentThreads()
-                .list(
-                    part=target,
-                    videoId=video,
-                    textFormat="plainText",
-                    pageToken=response["nextPageToken"],
-                )
-                .execute()
-            )
+            response = comment_threads.list(
+                part=target,
+                videoId=video,
+                textFormat="plainText",
+                pageToken=response["nextPageToken"],
+            ).execute()
         else:
             break
 
-    return comments
+    return columns